@@ -1,49 +1,73 @@
-import time
-from collections import defaultdict
+import asyncio
+from typing import Optional
 from fastapi import FastAPI, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from contextlib import asynccontextmanager
 import httpx
 
-from homelab_common import setup_logging, get_logger, get_settings
+from homelab_common import setup_logging, get_logger, get_settings, create_http_client
 from homelab_schemas import ChatRequest, ChatResponse
+from .rate_limit import RateLimiter, create_rate_limiter
 
 settings = get_settings()
 logger = get_logger(__name__)
 
-# Simple in-memory rate limiting
-rate_limit_store: dict[str, list[float]] = defaultdict(list)
+# In-memory rate limiting (fixed-size record per key), created on first use
+rate_limiter: Optional[RateLimiter] = None
+
+# Pooled client for the orchestrator, created in lifespan
+orchestrator_client: Optional[httpx.AsyncClient] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the gateway rate limiter, creating it from settings if needed."""
+    global rate_limiter
+    if rate_limiter is None:
+        rate_limiter = create_rate_limiter(
+            settings.rate_limit_algorithm,
+            settings.rate_limit_requests,
+            settings.rate_limit_window,
+            settings.rate_limit_burst,
+        )
+    return rate_limiter
 
 
 def check_rate_limit(api_key: str) -> bool:
     """Check if the request is within rate limits."""
-    now = time.time()
-    window_start = now - settings.rate_limit_window
-
-    # Clean old entries
-    rate_limit_store[api_key] = [
-        ts for ts in rate_limit_store[api_key] if ts > window_start
-    ]
+    return get_rate_limiter().allow(api_key)
 
-    # Check limit
-    if len(rate_limit_store[api_key]) >= settings.rate_limit_requests:
-        return False
 
-    # Record this request
-    rate_limit_store[api_key].append(now)
-    return True
+async def evict_idle_rate_limits(interval: float) -> None:
+    """Periodically drop rate limit records for keys that have gone idle."""
+    while True:
+        await asyncio.sleep(interval)
+        evicted = get_rate_limiter().evict_idle()
+        if evicted:
+            logger.debug(f"Evicted {evicted} idle rate limit keys")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global orchestrator_client
     setup_logging(settings.log_level, "gateway")
     logger.info("Gateway service starting")
 
     if not settings.api_key:
         logger.warning("API_KEY not set - authentication disabled")
 
+    orchestrator_client = create_http_client(settings.orchestrator_url, settings.orchestrator_timeout)
+    get_rate_limiter()
+    eviction_task = asyncio.create_task(
+        evict_idle_rate_limits(settings.rate_limit_cleanup_interval)
+    )
+
     yield
     logger.info("Gateway service shutting down")
+    eviction_task.cancel()
+    await orchestrator_client.aclose()
+    orchestrator_client = None
 
 
 app = FastAPI(
@@ -67,16 +91,8 @@ async def health():
     return {"status": "healthy", "service": "gateway"}
 
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(
-    request: ChatRequest,
-    x_api_key: str = Header(None, alias="X-API-Key"),
-):
-    """
-    Send a chat message to the assistant.
-
-    Requires X-API-Key header for authentication.
-    """
+def authorize(x_api_key: Optional[str]) -> None:
+    """Authenticate the caller and apply rate limiting, raising on failure."""
     # Authentication
     if settings.api_key:
         if not x_api_key:
@@ -92,21 +108,72 @@ async def chat(
             detail=f"Rate limit exceeded. Max {settings.rate_limit_requests} requests per {settings.rate_limit_window} seconds",
         )
 
+
+@app.post("/chat", response_model=ChatResponse)
+async def chat(
+    request: ChatRequest,
+    x_api_key: str = Header(None, alias="X-API-Key"),
+):
+    """
+    Send a chat message to the assistant.
+
+    Requires X-API-Key header for authentication.
+    """
+    authorize(x_api_key)
+
+    if orchestrator_client is None:
+        raise HTTPException(status_code=503, detail="Gateway not ready")
+
     # Forward to orchestrator
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        try:
-            response = await client.post(
-                f"{settings.orchestrator_url}/chat",
-                json=request.model_dump(),
-            )
-            response.raise_for_status()
-            return ChatResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Orchestrator returned error: {e.response.status_code}")
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=e.response.text,
-            )
-        except httpx.RequestError as e:
-            logger.error(f"Failed to reach orchestrator: {e}")
-            raise HTTPException(status_code=502, detail="Backend service unavailable")
+    try:
+        response = await orchestrator_client.post("/chat", json=request.model_dump())
+        response.raise_for_status()
+        return ChatResponse(**response.json())
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Orchestrator returned error: {e.response.status_code}")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=e.response.text,
+        )
+    except httpx.RequestError as e:
+        logger.error(f"Failed to reach orchestrator: {e}")
+        raise HTTPException(status_code=502, detail="Backend service unavailable")
+
+
+@app.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    x_api_key: str = Header(None, alias="X-API-Key"),
+):
+    """
+    Send a chat message and stream the reply as Server-Sent Events.
+
+    Events are proxied unchanged from the orchestrator: `token`, `progress`,
+    then a final `done` (or `error`). Requires X-API-Key header.
+    """
+    authorize(x_api_key)
+
+    if orchestrator_client is None:
+        raise HTTPException(status_code=503, detail="Gateway not ready")
+
+    upstream_request = orchestrator_client.build_request(
+        "POST", "/chat/stream", json=request.model_dump()
+    )
+    try:
+        response = await orchestrator_client.send(upstream_request, stream=True)
+    except httpx.RequestError as e:
+        logger.error(f"Failed to reach orchestrator: {e}")
+        raise HTTPException(status_code=502, detail="Backend service unavailable")
+
+    if response.is_error:
+        await response.aread()
+        await response.aclose()
+        logger.error(f"Orchestrator returned error: {response.status_code}")
+        raise HTTPException(status_code=response.status_code, detail=response.text)
+
+    return StreamingResponse(
+        response.aiter_raw(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(response.aclose),
+    )
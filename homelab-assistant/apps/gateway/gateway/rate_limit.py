@@ -0,0 +1,106 @@
+"""Constant-time, fixed-memory rate limiters for the gateway."""
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class RateLimiter(ABC):
+    """
+    Per-key rate limiter that stores one fixed-size record per key.
+
+    Allows `requests` requests per `window` seconds on average, with bursts of
+    up to `burst` requests. Checking a request is O(1) regardless of the limit,
+    and keys whose record has fully recovered can be evicted without changing
+    behaviour, which keeps memory bounded by the number of active clients.
+    """
+
+    def __init__(self, requests: int, window: float, burst: Optional[int] = None):
+        if requests <= 0 or window <= 0:
+            raise ValueError("requests and window must be positive")
+        self.requests = requests
+        self.window = window
+        self.burst = burst if burst and burst > 0 else requests
+        self.store: dict = {}
+
+    @abstractmethod
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        """Record a request for `key` and return whether it is within limits."""
+        pass
+
+    @abstractmethod
+    def _is_idle(self, record, now: float) -> bool:
+        """Return True if the record is indistinguishable from a fresh key."""
+        pass
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Drop records for keys that have fully recovered. Returns the count evicted."""
+        now = time.monotonic() if now is None else now
+        idle = [key for key, record in self.store.items() if self._is_idle(record, now)]
+        for key in idle:
+            del self.store[key]
+        return len(idle)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+
+class GCRARateLimiter(RateLimiter):
+    """Generic Cell Rate Algorithm: one float (theoretical arrival time) per key."""
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        interval = self.window / self.requests
+
+        tat = max(self.store.get(key, now), now)
+        new_tat = tat + interval
+        if new_tat - now > interval * self.burst:
+            return False
+
+        self.store[key] = new_tat
+        return True
+
+    def _is_idle(self, record: float, now: float) -> bool:
+        return record <= now
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token bucket: a (tokens, last_refill) pair per key."""
+
+    def _refill(self, key: str, now: float) -> float:
+        tokens, last = self.store.get(key, (float(self.burst), now))
+        rate = self.requests / self.window
+        return min(float(self.burst), tokens + (now - last) * rate)
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        tokens = self._refill(key, now)
+        if tokens < 1.0:
+            self.store[key] = (tokens, now)
+            return False
+
+        self.store[key] = (tokens - 1.0, now)
+        return True
+
+    def _is_idle(self, record: tuple[float, float], now: float) -> bool:
+        tokens, last = record
+        return tokens + (now - last) * self.requests / self.window >= self.burst
+
+
+RATE_LIMIT_ALGORITHMS: dict[str, type[RateLimiter]] = {
+    "gcra": GCRARateLimiter,
+    "token_bucket": TokenBucketRateLimiter,
+}
+
+
+def create_rate_limiter(
+    algorithm: str,
+    requests: int,
+    window: float,
+    burst: Optional[int] = None,
+) -> RateLimiter:
+    """Create a rate limiter by algorithm name ("gcra" or "token_bucket")."""
+    try:
+        limiter_cls = RATE_LIMIT_ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+    return limiter_cls(requests, window, burst)
@@ -1,8 +1,10 @@
+from typing import AsyncIterator
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from contextlib import asynccontextmanager
 
-from homelab_common import setup_logging, get_logger, get_settings
-from homelab_schemas import LLMRequest, LLMResponse
+from homelab_common import setup_logging, get_logger, get_settings, format_sse
+from homelab_schemas import LLMRequest, LLMResponse, StreamEventType
 from .providers.openai_provider import OpenAIProvider
 from .providers.groq_provider import GroqProvider
 
@@ -72,3 +74,32 @@ async def chat(request: LLMRequest):
     except Exception as e:
         logger.error(f"LLM request failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/chat/stream")
+async def chat_stream(request: LLMRequest):
+    """
+    Stream a chat request to the LLM as Server-Sent Events.
+
+    Emits `token` events with text deltas, then a single `response` event
+    carrying the complete LLMResponse (or an `error` event on failure).
+    """
+    if not provider:
+        raise HTTPException(status_code=503, detail="LLM provider not configured")
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for item in provider.chat_stream(
+                messages=request.messages,
+                tools=request.tools,
+                system_prompt=request.system_prompt,
+            ):
+                if isinstance(item, LLMResponse):
+                    yield format_sse(StreamEventType.RESPONSE.value, item.model_dump())
+                else:
+                    yield format_sse(StreamEventType.TOKEN.value, {"content": item})
+        except Exception as e:
+            logger.error(f"LLM streaming request failed: {e}")
+            yield format_sse(StreamEventType.ERROR.value, {"detail": str(e)})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
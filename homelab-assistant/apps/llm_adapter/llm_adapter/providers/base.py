@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional, Union
 
 from homelab_schemas import LLMResponse, ToolDefinition
 
@@ -26,3 +26,23 @@ class BaseLLMProvider(ABC):
             LLMResponse with content and/or tool calls
         """
         pass
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[ToolDefinition],
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream a chat request to the LLM.
+
+        Providers without native streaming inherit this fallback, which
+        emits the whole response as a single chunk.
+
+        Yields:
+            Text deltas as they arrive, then the complete LLMResponse last
+        """
+        response = await self.chat(messages, tools, system_prompt)
+        if response.content:
+            yield response.content
+        yield response
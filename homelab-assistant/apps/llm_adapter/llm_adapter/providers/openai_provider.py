@@ -1,10 +1,11 @@
 import json
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional, Union
 
 from openai import AsyncOpenAI
 
 from homelab_schemas import LLMResponse, ToolDefinition
 from .base import BaseLLMProvider
+from .streaming import iter_openai_stream
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -64,3 +65,34 @@ class OpenAIProvider(BaseLLMProvider):
             tool_calls=tool_calls,
             finish_reason=choice.finish_reason,
         )
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[ToolDefinition],
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """Stream a chat request to OpenAI."""
+
+        request_messages = []
+
+        if system_prompt:
+            request_messages.append({
+                "role": "system",
+                "content": system_prompt,
+            })
+
+        request_messages.extend(messages)
+
+        kwargs = {
+            "model": self.model,
+            "messages": request_messages,
+            "stream": True,
+        }
+
+        if tools:
+            kwargs["tools"] = [tool.to_openai_function() for tool in tools]
+
+        stream = await self.client.chat.completions.create(**kwargs)
+        async for item in iter_openai_stream(stream):
+            yield item
@@ -0,0 +1,51 @@
+import json
+from typing import Any, AsyncIterator, Union
+
+from homelab_schemas import LLMResponse
+
+
+async def iter_openai_stream(stream: AsyncIterator[Any]) -> AsyncIterator[Union[str, LLMResponse]]:
+    """
+    Convert an OpenAI-compatible chat completion stream into text deltas.
+
+    Tool call fragments are accumulated by index and returned in the final
+    LLMResponse, which is always the last item yielded.
+    """
+    content_parts: list[str] = []
+    tool_calls: dict[int, dict[str, Any]] = {}
+    finish_reason = "stop"
+
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        delta = choice.delta
+
+        if delta.content:
+            content_parts.append(delta.content)
+            yield delta.content
+
+        for tc in delta.tool_calls or []:
+            call = tool_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+            if tc.id:
+                call["id"] = tc.id
+            if tc.function and tc.function.name:
+                call["name"] += tc.function.name
+            if tc.function and tc.function.arguments:
+                call["arguments"] += tc.function.arguments
+
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+
+    yield LLMResponse(
+        content="".join(content_parts) or None,
+        tool_calls=[
+            {
+                "id": call["id"],
+                "name": call["name"],
+                "arguments": json.loads(call["arguments"] or "{}"),
+            }
+            for _, call in sorted(tool_calls.items())
+        ],
+        finish_reason=finish_reason,
+    )
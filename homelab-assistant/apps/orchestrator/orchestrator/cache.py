@@ -0,0 +1,112 @@
+"""Shared TTL cache for tool results with stale-while-revalidate."""
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from homelab_common import get_logger
+from .singleflight import SingleFlight
+
+logger = get_logger(__name__)
+
+
+def tool_cache_key(name: str, arguments: dict[str, Any]) -> str:
+    """Cache key for a tool call: tool name plus canonical JSON arguments."""
+    return f"{name}:{json.dumps(arguments, sort_keys=True, separators=(',', ':'))}"
+
+
+class ToolResultCache:
+    """
+    Bounded LRU cache of tool results, shared across conversations.
+
+    Within `ttl` seconds of being fetched an entry is served as-is. For a
+    further `stale_ttl` seconds it is still served, but a single background
+    refresh is started so the next caller sees fresh data. Older entries are
+    refetched inline. Concurrent misses for the same key share one fetch, so
+    the backend sees at most one request per key per TTL regardless of load.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        stale_ttl: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._fetches = SingleFlight()
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refresh_errors = 0
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for key, fetching it if missing or expired."""
+        if ttl <= 0:
+            return await fetch()
+
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched_at, value = entry
+            age = now - fetched_at
+            if age < ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if age < ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._refresh_in_background(key, fetch)
+                return value
+
+        self.misses += 1
+        return await self._fetches.do(key, lambda: self._fetch_and_store(key, fetch))
+
+    async def _fetch_and_store(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetches.do(key, lambda: self._fetch_and_store(key, fetch))
+            except Exception as e:
+                self.refresh_errors += 1
+                logger.warning(f"Background refresh failed for {key}: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refresh_errors": self.refresh_errors,
+        }
@@ -1,17 +1,43 @@
+import asyncio
 import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from contextlib import asynccontextmanager
 import httpx
 
-from homelab_common import setup_logging, get_logger, get_settings
-from homelab_schemas import ChatRequest, ChatResponse, LLMRequest, LLMResponse
-from .tools import AVAILABLE_TOOLS, execute_tool
+from homelab_common import (
+    setup_logging,
+    get_logger,
+    get_settings,
+    create_http_client,
+    format_sse,
+    iter_sse_events,
+)
+from homelab_schemas import ChatRequest, ChatResponse, LLMRequest, LLMResponse, StreamEventType
+from .tools import AVAILABLE_TOOLS, TOOL_CACHE_TTL, execute_tool
+from .cache import ToolResultCache, tool_cache_key
 from .audit import write_audit_log
 from .database import init_db, record_session, get_enabled_tools
+from .singleflight import SingleFlight, request_fingerprint
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Pooled clients for downstream services, created in lifespan
+llm_client: Optional[httpx.AsyncClient] = None
+monitoring_client: Optional[httpx.AsyncClient] = None
+
+# Coalesces concurrent identical /chat requests onto one agent run
+chat_flight = SingleFlight()
+
+# Tool results shared across conversations, with per-tool TTLs
+tool_cache = ToolResultCache(
+    max_entries=settings.tool_cache_max_entries,
+    stale_ttl=settings.tool_cache_stale_ttl,
+)
+
 SYSTEM_PROMPT = """You are a helpful homelab assistant. You help users monitor and understand their homelab infrastructure.
 
 You have access to monitoring tools that allow you to:
@@ -27,14 +53,27 @@ IMPORTANT SAFETY RULES:
 
 Always be helpful and provide clear explanations of the monitoring data you retrieve."""
 
+MAX_ITERATIONS = 5  # Prevent infinite tool-calling loops
+NO_RESPONSE_MESSAGE = "I apologize, but I couldn't generate a response."
+MAX_ITERATIONS_MESSAGE = "I apologize, but I wasn't able to complete your request. Please try again."
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global llm_client, monitoring_client
     setup_logging(settings.log_level, "orchestrator")
     logger.info("Orchestrator service starting")
     await init_db(settings.db_path)
+
+    llm_client = create_http_client(settings.llm_adapter_url, settings.llm_adapter_timeout)
+    monitoring_client = create_http_client(settings.monitoring_url, settings.monitoring_timeout)
+
     yield
     logger.info("Orchestrator service shutting down")
+    await llm_client.aclose()
+    await monitoring_client.aclose()
+    llm_client = None
+    monitoring_client = None
 
 
 app = FastAPI(
@@ -51,50 +90,241 @@ async def health():
     return {"status": "healthy", "service": "orchestrator"}
 
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """Process a chat request from the user."""
+@app.get("/stats")
+async def stats():
+    """Runtime counters for the orchestrator's shared caches and coalescing."""
+    return {
+        "chat_coalescing": chat_flight.stats(),
+        "tool_cache": tool_cache.stats(),
+    }
+
+
+async def fetch_tool_result(
+    name: str,
+    arguments: dict[str, Any],
+    enabled_tools: set[str],
+) -> Any:
+    """Execute a tool through the shared result cache."""
+    if name not in enabled_tools:
+        raise ValueError(f"Unknown tool: {name}")
+
+    return await tool_cache.get_or_fetch(
+        tool_cache_key(name, arguments),
+        TOOL_CACHE_TTL.get(name, 0.0),
+        lambda: execute_tool(name, arguments, monitoring_client, enabled_tools),
+    )
+
+
+async def run_tool_calls(
+    tool_calls: list[dict[str, Any]],
+    enabled_tools: set[str],
+) -> list[dict[str, Any]]:
+    """
+    Execute the tool calls from one LLM turn concurrently.
+
+    At most settings.tool_max_concurrency calls run at once and each is bounded
+    by settings.tool_call_timeout. Tool messages are returned in the order the
+    LLM requested them, each carrying its own tool_call_id.
+    """
+    semaphore = asyncio.Semaphore(settings.tool_max_concurrency)
+
+    async def run_one(tool_call: dict[str, Any]) -> dict[str, Any]:
+        tool_name = tool_call["name"]
+        tool_args = tool_call["arguments"]
+        tool_id = tool_call["id"]
+
+        async with semaphore:
+            logger.info(f"Executing tool: {tool_name}")
+            try:
+                result = await asyncio.wait_for(
+                    fetch_tool_result(tool_name, tool_args, enabled_tools),
+                    timeout=settings.tool_call_timeout,
+                )
+                content = str(result)
+            except ValueError as e:
+                content = f"Error: {e}"
+            except asyncio.TimeoutError:
+                logger.warning(f"Tool {tool_name} timed out after {settings.tool_call_timeout}s")
+                content = f"Error: {tool_name} timed out"
+
+        return {
+            "role": "tool",
+            "tool_call_id": tool_id,
+            "content": content,
+        }
+
+    return list(await asyncio.gather(*(run_one(tc) for tc in tool_calls)))
+
+
+def assistant_tool_call_message(llm_data: LLMResponse) -> dict[str, Any]:
+    """Build the assistant message that records the tool calls of one LLM turn."""
+    return {
+        "role": "assistant",
+        "content": llm_data.content,
+        "tool_calls": [
+            {
+                "id": tc["id"],
+                "type": "function",
+                "function": {
+                    "name": tc["name"],
+                    "arguments": str(tc["arguments"]),
+                },
+            }
+            for tc in llm_data.tool_calls
+        ],
+    }
+
+
+async def start_conversation(request: ChatRequest) -> tuple[str, set[str]]:
+    """Resolve the conversation ID, record the session and load enabled tools."""
+    if llm_client is None or monitoring_client is None:
+        raise HTTPException(status_code=503, detail="Orchestrator not ready")
+
     conversation_id = request.conversation_id or str(uuid.uuid4())
 
     logger.info(f"Processing chat request: conversation_id={conversation_id}")
 
     await record_session(settings.db_path, conversation_id)
     enabled_tools = await get_enabled_tools(settings.db_path)
+    return conversation_id, enabled_tools
 
+
+@dataclass
+class AgentResult:
+    """Outcome of one agent run, independent of the conversation that asked for it."""
+    message: str
+    tool_calls_made: list[str] = field(default_factory=list)
+    completed: bool = True  # False when MAX_ITERATIONS was hit
+
+
+async def run_agent(message: str, enabled_tools: set[str]) -> AgentResult:
+    """Run the LLM/tool loop for a single user message."""
     # Build the messages for the LLM
-    messages = [{"role": "user", "content": request.message}]
+    messages = [{"role": "user", "content": message}]
 
     # Get tool definitions
     tools = list(AVAILABLE_TOOLS.values())
 
     tool_calls_made = []
-    max_iterations = 5  # Prevent infinite loops
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        for iteration in range(max_iterations):
-            # Call the LLM adapter
+    for iteration in range(MAX_ITERATIONS):
+        # Call the LLM adapter
+        llm_request = LLMRequest(
+            messages=messages,
+            tools=tools,
+            system_prompt=SYSTEM_PROMPT,
+        )
+
+        try:
+            llm_response = await llm_client.post("/chat", json=llm_request.model_dump())
+            llm_response.raise_for_status()
+            llm_data = LLMResponse(**llm_response.json())
+        except httpx.HTTPError as e:
+            logger.error(f"LLM adapter request failed: {e}")
+            raise HTTPException(status_code=502, detail="LLM service unavailable")
+
+        # If no tool calls, we're done
+        if not llm_data.tool_calls:
+            return AgentResult(
+                message=llm_data.content or NO_RESPONSE_MESSAGE,
+                tool_calls_made=tool_calls_made,
+            )
+
+        # Execute tool calls
+        tool_calls_made.extend(tc["name"] for tc in llm_data.tool_calls)
+        tool_results = await run_tool_calls(llm_data.tool_calls, enabled_tools)
+
+        # Add assistant message with tool calls and tool results to conversation
+        messages.append(assistant_tool_call_message(llm_data))
+        messages.extend(tool_results)
+
+    return AgentResult(
+        message=MAX_ITERATIONS_MESSAGE,
+        tool_calls_made=tool_calls_made,
+        completed=False,
+    )
+
+
+@app.post("/chat", response_model=ChatResponse)
+async def chat(request: ChatRequest):
+    """
+    Process a chat request from the user.
+
+    Identical concurrent requests (same normalized message and tool set) are
+    coalesced onto one agent run; each caller keeps its own conversation_id.
+    """
+    conversation_id, enabled_tools = await start_conversation(request)
+
+    if settings.chat_coalescing_enabled:
+        key = request_fingerprint(request.message, enabled_tools)
+        result = await chat_flight.do(key, lambda: run_agent(request.message, enabled_tools))
+    else:
+        result = await run_agent(request.message, enabled_tools)
+
+    if not result.completed:
+        logger.warning(f"Max iterations reached for conversation {conversation_id}")
+    else:
+        # Write audit log
+        await write_audit_log(
+            conversation_id=conversation_id,
+            user_message=request.message,
+            assistant_response=result.message,
+            tool_calls=result.tool_calls_made,
+        )
+
+    return ChatResponse(
+        message=result.message,
+        conversation_id=conversation_id,
+        tool_calls_made=list(result.tool_calls_made),
+    )
+
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Process a chat request and stream progress as Server-Sent Events.
+
+    Emits `token` events as the LLM writes, `progress` events when tools are
+    called, and a final `done` event carrying the same ChatResponse as /chat.
+    """
+    conversation_id, enabled_tools = await start_conversation(request)
+
+    async def event_stream() -> AsyncIterator[str]:
+        messages = [{"role": "user", "content": request.message}]
+        tools = list(AVAILABLE_TOOLS.values())
+        tool_calls_made = []
+
+        for iteration in range(MAX_ITERATIONS):
             llm_request = LLMRequest(
                 messages=messages,
                 tools=tools,
                 system_prompt=SYSTEM_PROMPT,
             )
 
+            llm_data = None
             try:
-                llm_response = await client.post(
-                    f"{settings.llm_adapter_url}/chat",
-                    json=llm_request.model_dump(),
-                )
-                llm_response.raise_for_status()
-                llm_data = LLMResponse(**llm_response.json())
+                async with llm_client.stream(
+                    "POST", "/chat/stream", json=llm_request.model_dump()
+                ) as llm_response:
+                    llm_response.raise_for_status()
+                    async for event, data in iter_sse_events(llm_response.aiter_lines()):
+                        if event == StreamEventType.TOKEN.value:
+                            yield format_sse(event, data)
+                        elif event == StreamEventType.RESPONSE.value:
+                            llm_data = LLMResponse(**data)
+                        elif event == StreamEventType.ERROR.value:
+                            logger.error(f"LLM adapter stream failed: {data.get('detail')}")
+                            break
             except httpx.HTTPError as e:
                 logger.error(f"LLM adapter request failed: {e}")
-                raise HTTPException(status_code=502, detail="LLM service unavailable")
 
-            # If no tool calls, we're done
+            if llm_data is None:
+                yield format_sse(StreamEventType.ERROR.value, {"detail": "LLM service unavailable"})
+                return
+
             if not llm_data.tool_calls:
-                final_response = llm_data.content or "I apologize, but I couldn't generate a response."
+                final_response = llm_data.content or NO_RESPONSE_MESSAGE
 
-                # Write audit log
                 await write_audit_log(
                     conversation_id=conversation_id,
                     user_message=request.message,
@@ -102,58 +332,31 @@ async def chat(request: ChatRequest):
                     tool_calls=tool_calls_made,
                 )
 
-                return ChatResponse(
+                done = ChatResponse(
                     message=final_response,
                     conversation_id=conversation_id,
                     tool_calls_made=tool_calls_made,
                 )
+                yield format_sse(StreamEventType.DONE.value, done.model_dump())
+                return
+
+            for tc in llm_data.tool_calls:
+                tool_calls_made.append(tc["name"])
+                yield format_sse(
+                    StreamEventType.PROGRESS.value,
+                    {"tool": tc["name"], "message": f"Calling {tc['name']}..."},
+                )
+            tool_results = await run_tool_calls(llm_data.tool_calls, enabled_tools)
 
-            # Execute tool calls
-            tool_results = []
-            for tool_call in llm_data.tool_calls:
-                tool_name = tool_call["name"]
-                tool_args = tool_call["arguments"]
-                tool_id = tool_call["id"]
-
-                logger.info(f"Executing tool: {tool_name}")
-                tool_calls_made.append(tool_name)
-
-                try:
-                    result = await execute_tool(tool_name, tool_args, settings, enabled_tools)
-                    tool_results.append({
-                        "role": "tool",
-                        "tool_call_id": tool_id,
-                        "content": str(result),
-                    })
-                except ValueError as e:
-                    tool_results.append({
-                        "role": "tool",
-                        "tool_call_id": tool_id,
-                        "content": f"Error: {e}",
-                    })
-
-            # Add assistant message with tool calls and tool results to conversation
-            messages.append({
-                "role": "assistant",
-                "content": llm_data.content,
-                "tool_calls": [
-                    {
-                        "id": tc["id"],
-                        "type": "function",
-                        "function": {
-                            "name": tc["name"],
-                            "arguments": str(tc["arguments"]),
-                        },
-                    }
-                    for tc in llm_data.tool_calls
-                ],
-            })
+            messages.append(assistant_tool_call_message(llm_data))
             messages.extend(tool_results)
 
-    # If we hit max iterations
-    logger.warning(f"Max iterations reached for conversation {conversation_id}")
-    return ChatResponse(
-        message="I apologize, but I wasn't able to complete your request. Please try again.",
-        conversation_id=conversation_id,
-        tool_calls_made=tool_calls_made,
-    )
+        logger.warning(f"Max iterations reached for conversation {conversation_id}")
+        done = ChatResponse(
+            message=MAX_ITERATIONS_MESSAGE,
+            conversation_id=conversation_id,
+            tool_calls_made=tool_calls_made,
+        )
+        yield format_sse(StreamEventType.DONE.value, done.model_dump())
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -0,0 +1,70 @@
+"""Request coalescing: concurrent identical calls share one in-flight computation."""
+import asyncio
+import hashlib
+import re
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from homelab_common import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.,;:]+$")
+
+
+def normalize_message(message: str) -> str:
+    """Normalize a user message so trivially different phrasings compare equal."""
+    normalized = _WHITESPACE.sub(" ", message.strip().lower())
+    return _TRAILING_PUNCTUATION.sub("", normalized)
+
+
+def request_fingerprint(message: str, tool_names: Iterable[str]) -> str:
+    """Key a chat request on its normalized message and the set of tools it may use."""
+    material = normalize_message(message) + "\0" + ",".join(sorted(tool_names))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    The first caller for a key starts the computation; callers arriving while
+    it is still running await the same result (or exception) instead of
+    starting their own. The computation runs as its own task, so a caller that
+    disconnects does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn() for key, or join the call already in flight for key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"Coalesced request onto in-flight call {key[:12]}")
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "started": self.started,
+            "coalesced": self.coalesced,
+        }
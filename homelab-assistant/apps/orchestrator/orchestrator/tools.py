@@ -2,7 +2,6 @@ from typing import Any
 import httpx
 
 from homelab_schemas import ToolDefinition
-from homelab_common import Settings
 
 # Define available tools
 AVAILABLE_TOOLS: dict[str, ToolDefinition] = {
@@ -18,29 +17,43 @@ AVAILABLE_TOOLS: dict[str, ToolDefinition] = {
     ),
 }
 
+# How long each tool's result may be served from the shared result cache
+# (seconds). Tools not listed here are never cached.
+TOOL_CACHE_TTL: dict[str, float] = {
+    "get_system_resources": 2.0,
+    "list_containers": 5.0,
+}
+
 
 async def execute_tool(
     name: str,
     arguments: dict[str, Any],
-    settings: Settings,
+    client: httpx.AsyncClient,
     enabled_tools: set[str] | None = None,
 ) -> Any:
-    """Execute a tool and return the result."""
+    """
+    Execute a tool and return the result.
+
+    Args:
+        name: Tool name as requested by the LLM
+        arguments: Tool arguments
+        client: Pooled client bound to the tool-monitoring service
+        enabled_tools: Names of tools currently enabled (defaults to all)
+    """
 
     active = enabled_tools if enabled_tools is not None else set(AVAILABLE_TOOLS.keys())
     if name not in active:
         raise ValueError(f"Unknown tool: {name}")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        if name == "get_system_resources":
-            response = await client.get(f"{settings.monitoring_url}/system/resources")
-            response.raise_for_status()
-            return response.json()
+    if name == "get_system_resources":
+        response = await client.get("/system/resources")
+        response.raise_for_status()
+        return response.json()
 
-        elif name == "list_containers":
-            response = await client.get(f"{settings.monitoring_url}/containers")
-            response.raise_for_status()
-            return response.json()
+    elif name == "list_containers":
+        response = await client.get("/containers")
+        response.raise_for_status()
+        return response.json()
 
-        else:
-            raise ValueError(f"Tool not implemented: {name}")
+    else:
+        raise ValueError(f"Tool not implemented: {name}")
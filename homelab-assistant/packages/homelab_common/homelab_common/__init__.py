@@ -1,4 +1,14 @@
 from .config import get_settings, Settings
+from .http import create_http_client
 from .logging import get_logger, setup_logging
+from .sse import format_sse, iter_sse_events
 
-__all__ = ["get_settings", "Settings", "get_logger", "setup_logging"]
+__all__ = [
+    "get_settings",
+    "Settings",
+    "create_http_client",
+    "get_logger",
+    "setup_logging",
+    "format_sse",
+    "iter_sse_events",
+]
@@ -12,6 +12,15 @@ class Settings(BaseSettings):
     llm_adapter_url: str = "http://llm-adapter:8002"
     monitoring_url: str = "http://tool-monitoring:8003"
 
+    # Internal HTTP clients (pooled, one per destination)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0  # seconds
+    http_connect_timeout: float = 5.0  # seconds
+    orchestrator_timeout: float = 120.0  # gateway -> orchestrator
+    llm_adapter_timeout: float = 60.0  # orchestrator -> llm-adapter
+    monitoring_timeout: float = 30.0  # orchestrator -> tool-monitoring
+
     # Authentication
     api_key: str = ""
     openai_api_key: str = ""
@@ -23,6 +32,16 @@ class Settings(BaseSettings):
     # Rate limiting
     rate_limit_requests: int = 60
     rate_limit_window: int = 60  # seconds
+    rate_limit_algorithm: str = "gcra"  # "gcra" or "token_bucket"
+    rate_limit_burst: int = 0  # 0 = same as rate_limit_requests
+    rate_limit_cleanup_interval: float = 60.0  # seconds between idle-key sweeps
+
+    # Orchestrator
+    chat_coalescing_enabled: bool = True  # share one run across identical concurrent /chat requests
+    tool_max_concurrency: int = 4  # tool calls from one LLM turn run in parallel up to this cap
+    tool_call_timeout: float = 20.0  # seconds, per tool call
+    tool_cache_max_entries: int = 256
+    tool_cache_stale_ttl: float = 10.0  # seconds past a tool's TTL to serve stale while refreshing
 
     # Logging
     log_level: str = "INFO"
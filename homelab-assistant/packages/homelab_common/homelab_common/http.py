@@ -0,0 +1,40 @@
+from typing import Optional
+
+import httpx
+
+from .config import Settings, get_settings
+
+
+def create_http_client(
+    base_url: str,
+    timeout: float,
+    settings: Optional[Settings] = None,
+) -> httpx.AsyncClient:
+    """
+    Create a long-lived pooled HTTP client for one internal destination.
+
+    Clients are meant to be created once in a service's lifespan and reused for
+    every request, so connections to the destination stay warm (keep-alive)
+    instead of paying for DNS, TCP setup and a cold pool on each call.
+
+    Args:
+        base_url: Destination service URL (e.g. settings.orchestrator_url)
+        timeout: Overall read/write/pool timeout in seconds for this destination
+        settings: Settings to read pool limits from (defaults to get_settings())
+
+    Returns:
+        An httpx.AsyncClient; the caller owns it and must aclose() it on shutdown
+    """
+    settings = settings or get_settings()
+
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(timeout, connect=settings.http_connect_timeout),
+        limits=limits,
+    )
@@ -0,0 +1,35 @@
+import json
+from typing import Any, AsyncIterator
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one Server-Sent Event with a JSON data payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def iter_sse_events(lines: AsyncIterator[str]) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Parse a Server-Sent Events stream into (event, data) pairs.
+
+    Args:
+        lines: Decoded lines of the stream, e.g. httpx Response.aiter_lines()
+
+    Yields:
+        Event name (defaults to "message") and the JSON-decoded data payload
+    """
+    event = "message"
+    data_lines: list[str] = []
+
+    async for line in lines:
+        if not line:
+            if data_lines:
+                yield event, json.loads("\n".join(data_lines))
+            event = "message"
+            data_lines = []
+        elif line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data_lines.append(line[len("data:"):].strip())
+
+    if data_lines:
+        yield event, json.loads("\n".join(data_lines))
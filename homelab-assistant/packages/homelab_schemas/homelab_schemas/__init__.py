@@ -3,6 +3,7 @@ from .messages import (
     ChatResponse,
     Message,
     Role,
+    StreamEventType,
     ToolCall,
     ToolResult,
 )
@@ -18,6 +19,7 @@ __all__ = [
     "ChatResponse",
     "Message",
     "Role",
+    "StreamEventType",
     "ToolCall",
     "ToolResult",
     "ToolDefinition",
@@ -9,6 +9,15 @@ class Role(str, Enum):
     SYSTEM = "system"
 
 
+class StreamEventType(str, Enum):
+    """Server-Sent Event names used by the /chat/stream endpoints."""
+    TOKEN = "token"  # incremental assistant text: {"content": str}
+    PROGRESS = "progress"  # tool activity: {"tool": str, "message": str}
+    RESPONSE = "response"  # llm-adapter only: final LLMResponse
+    DONE = "done"  # orchestrator/gateway: final ChatResponse
+    ERROR = "error"  # {"detail": str}
+
+
 class ToolCall(BaseModel):
     """A tool call requested by the LLM."""
     id: str
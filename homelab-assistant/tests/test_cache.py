@@ -0,0 +1,138 @@
+"""Tests for the orchestrator's shared tool result cache."""
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def clock():
+    """Controllable clock; tests advance clock[0] and pass clock=lambda: clock[0]."""
+    return [1000.0]
+
+
+def _counting_fetch(values=None):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return (values or {}).get(len(calls), len(calls))
+
+    return fetch, calls
+
+
+def test_tool_cache_key_is_canonical():
+    from orchestrator.cache import tool_cache_key
+
+    assert tool_cache_key("t", {"b": 1, "a": 2}) == tool_cache_key("t", {"a": 2, "b": 1})
+    assert tool_cache_key("t", {}) != tool_cache_key("u", {})
+
+
+async def test_fresh_entry_is_served_from_cache(clock):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache(clock=lambda: clock[0])
+    fetch, calls = _counting_fetch()
+
+    assert await cache.get_or_fetch("k", 2.0, fetch) == 1
+    clock[0] += 1.0
+    assert await cache.get_or_fetch("k", 2.0, fetch) == 1
+
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_stale_entry_is_served_while_refreshing(clock):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache(stale_ttl=10.0, clock=lambda: clock[0])
+    fetch, calls = _counting_fetch()
+
+    await cache.get_or_fetch("k", 2.0, fetch)
+    clock[0] += 5.0
+
+    assert await cache.get_or_fetch("k", 2.0, fetch) == 1  # stale value returned immediately
+    await asyncio.sleep(0)  # let the background refresh run
+    await asyncio.sleep(0)
+    assert await cache.get_or_fetch("k", 2.0, fetch) == 2
+
+    assert len(calls) == 2
+    assert cache.stats()["stale_hits"] == 1
+
+
+async def test_expired_entry_is_refetched_inline(clock):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache(stale_ttl=1.0, clock=lambda: clock[0])
+    fetch, calls = _counting_fetch()
+
+    await cache.get_or_fetch("k", 2.0, fetch)
+    clock[0] += 10.0
+
+    assert await cache.get_or_fetch("k", 2.0, fetch) == 2
+    assert cache.stats()["misses"] == 2
+
+
+async def test_zero_ttl_bypasses_cache(clock):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache(clock=lambda: clock[0])
+    fetch, calls = _counting_fetch()
+
+    await cache.get_or_fetch("k", 0.0, fetch)
+    await cache.get_or_fetch("k", 0.0, fetch)
+
+    assert len(calls) == 2
+    assert cache.stats()["size"] == 0
+
+
+async def test_concurrent_misses_share_one_fetch(clock):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache(clock=lambda: clock[0])
+    calls = 0
+
+    async def slow_fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "data"
+
+    results = await asyncio.gather(*(cache.get_or_fetch("k", 5.0, slow_fetch) for _ in range(10)))
+
+    assert results == ["data"] * 10
+    assert calls == 1
+
+
+async def test_cache_is_bounded_lru(clock):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache(max_entries=2, clock=lambda: clock[0])
+
+    async def fetch():
+        return "v"
+
+    await cache.get_or_fetch("a", 5.0, fetch)
+    await cache.get_or_fetch("b", 5.0, fetch)
+    await cache.get_or_fetch("a", 5.0, fetch)  # touch a so b is least recently used
+    await cache.get_or_fetch("c", 5.0, fetch)
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert await cache.get_or_fetch("a", 5.0, fetch) == "v"
+    assert cache.stats()["hits"] == 2  # "a" still cached, "b" was evicted
+
+
+async def test_failed_fetch_is_not_cached(clock):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache(clock=lambda: clock[0])
+
+    async def failing_fetch():
+        raise RuntimeError("monitoring down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("k", 5.0, failing_fetch)
+
+    assert cache.stats()["size"] == 0
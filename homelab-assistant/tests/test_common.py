@@ -0,0 +1,38 @@
+"""Tests for shared homelab_common utilities."""
+from homelab_common import create_http_client
+from homelab_common.config import Settings
+
+
+async def test_create_http_client_binds_base_url_and_timeout():
+    client = create_http_client("http://test-monitoring:8003", 12.5, Settings())
+    try:
+        assert str(client.base_url) == "http://test-monitoring:8003"
+        assert client.timeout.read == 12.5
+        assert client.timeout.connect == Settings().http_connect_timeout
+    finally:
+        await client.aclose()
+
+
+async def test_create_http_client_uses_configured_pool_limits():
+    settings = Settings(http_max_connections=7, http_max_keepalive_connections=3)
+    client = create_http_client("http://test-orchestrator:8001", 30.0, settings)
+    try:
+        pool = client._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+    finally:
+        await client.aclose()
+
+
+async def test_sse_round_trip():
+    from homelab_common import format_sse, iter_sse_events
+
+    payload = format_sse("token", {"content": "Hel"}) + format_sse("done", {"ok": True})
+
+    async def lines():
+        for line in payload.split("\n"):
+            yield line
+
+    events = [event async for event in iter_sse_events(lines())]
+
+    assert events == [("token", {"content": "Hel"}), ("done", {"ok": True})]
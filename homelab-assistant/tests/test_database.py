@@ -1,6 +1,7 @@
 """Tests for the orchestrator database module."""
 import pytest
 import aiosqlite
+from unittest.mock import AsyncMock
 
 
 @pytest.fixture
@@ -139,18 +140,16 @@ async def test_get_enabled_tools_empty_when_all_disabled(db_path):
 
 async def test_execute_tool_respects_enabled_tools_set(mocker):
     from orchestrator.tools import execute_tool
-    from homelab_common.config import Settings
 
     # Only get_system_resources is enabled — list_containers should be rejected
     with pytest.raises(ValueError, match="Unknown tool"):
-        await execute_tool("list_containers", {}, Settings(), {"get_system_resources"})
+        await execute_tool("list_containers", {}, AsyncMock(), {"get_system_resources"})
 
 
 async def test_execute_tool_unknown_tool_raises_with_enabled_tools(mocker):
     from orchestrator.tools import execute_tool
-    from homelab_common.config import Settings
 
     with pytest.raises(ValueError, match="Unknown tool"):
         await execute_tool(
-            "nonexistent_tool", {}, Settings(), {"get_system_resources", "list_containers"}
+            "nonexistent_tool", {}, AsyncMock(), {"get_system_resources", "list_containers"}
         )
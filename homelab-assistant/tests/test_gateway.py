@@ -7,12 +7,8 @@ from httpx import AsyncClient, ASGITransport
 
 
 @pytest.fixture(autouse=True)
-def clear_rate_limit_store():
-    from gateway.main import rate_limit_store
-
-    rate_limit_store.clear()
-    yield
-    rate_limit_store.clear()
+def reset_rate_limiter(mocker):
+    mocker.patch("gateway.main.rate_limiter", None)
 
 
 @pytest.fixture
@@ -21,6 +17,8 @@ def mock_settings(mocker):
     mock.api_key = "test-api-key"
     mock.rate_limit_requests = 60
     mock.rate_limit_window = 60
+    mock.rate_limit_algorithm = "gcra"
+    mock.rate_limit_burst = 0
     mock.orchestrator_url = "http://test-orchestrator:8001"
     mocker.patch("gateway.main.settings", mock)
     return mock
@@ -66,10 +64,8 @@ async def test_chat_valid_key_forwards_to_orchestrator(gateway_client, mocker):
         "tool_calls_made": [],
     }
     mock_http = AsyncMock()
-    mock_http.__aenter__.return_value = mock_http
-    mock_http.__aexit__.return_value = None
     mock_http.post.return_value = mock_resp
-    mocker.patch("gateway.main.httpx.AsyncClient", return_value=mock_http)
+    mocker.patch("gateway.main.orchestrator_client", mock_http)
 
     response = await gateway_client.post(
         "/chat",
@@ -92,10 +88,8 @@ async def test_chat_forwards_correct_payload(gateway_client, mocker):
         "tool_calls_made": [],
     }
     mock_http = AsyncMock()
-    mock_http.__aenter__.return_value = mock_http
-    mock_http.__aexit__.return_value = None
     mock_http.post.return_value = mock_resp
-    mocker.patch("gateway.main.httpx.AsyncClient", return_value=mock_http)
+    mocker.patch("gateway.main.orchestrator_client", mock_http)
 
     await gateway_client.post(
         "/chat",
@@ -117,10 +111,8 @@ async def test_chat_rate_limit_exceeded(gateway_client, mock_settings, mocker):
     mock_resp.raise_for_status = MagicMock()
     mock_resp.json.return_value = {"message": "ok", "conversation_id": "c", "tool_calls_made": []}
     mock_http = AsyncMock()
-    mock_http.__aenter__.return_value = mock_http
-    mock_http.__aexit__.return_value = None
     mock_http.post.return_value = mock_resp
-    mocker.patch("gateway.main.httpx.AsyncClient", return_value=mock_http)
+    mocker.patch("gateway.main.orchestrator_client", mock_http)
 
     for _ in range(2):
         r = await gateway_client.post(
@@ -140,10 +132,8 @@ async def test_chat_rate_limit_exceeded(gateway_client, mock_settings, mocker):
 
 async def test_chat_orchestrator_unreachable_returns_502(gateway_client, mocker):
     mock_http = AsyncMock()
-    mock_http.__aenter__.return_value = mock_http
-    mock_http.__aexit__.return_value = None
     mock_http.post.side_effect = httpx.RequestError("connection refused")
-    mocker.patch("gateway.main.httpx.AsyncClient", return_value=mock_http)
+    mocker.patch("gateway.main.orchestrator_client", mock_http)
 
     response = await gateway_client.post(
         "/chat",
@@ -153,10 +143,78 @@ async def test_chat_orchestrator_unreachable_returns_502(gateway_client, mocker)
     assert response.status_code == 502
 
 
+async def test_chat_client_not_initialized_returns_503(gateway_client, mocker):
+    mocker.patch("gateway.main.orchestrator_client", None)
+
+    response = await gateway_client.post(
+        "/chat",
+        json={"message": "hello"},
+        headers={"X-API-Key": "test-api-key"},
+    )
+    assert response.status_code == 503
+
+
+def _mock_stream_response(status_code=200, chunks=(), text=""):
+    async def aiter_raw():
+        for chunk in chunks:
+            yield chunk
+
+    mock_resp = MagicMock()
+    mock_resp.status_code = status_code
+    mock_resp.is_error = status_code >= 400
+    mock_resp.text = text
+    mock_resp.aiter_raw = aiter_raw
+    mock_resp.aread = AsyncMock()
+    mock_resp.aclose = AsyncMock()
+    return mock_resp
+
+
+async def test_chat_stream_proxies_orchestrator_events(gateway_client, mocker):
+    upstream = _mock_stream_response(
+        chunks=[b"event: token\ndata: {\"content\": \"Hi\"}\n\n", b"event: done\ndata: {}\n\n"]
+    )
+    mock_http = MagicMock()
+    mock_http.send = AsyncMock(return_value=upstream)
+    mocker.patch("gateway.main.orchestrator_client", mock_http)
+
+    response = await gateway_client.post(
+        "/chat/stream",
+        json={"message": "hello"},
+        headers={"X-API-Key": "test-api-key"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == 'event: token\ndata: {"content": "Hi"}\n\nevent: done\ndata: {}\n\n'
+    mock_http.build_request.assert_called_once()
+    assert mock_http.build_request.call_args[0][:2] == ("POST", "/chat/stream")
+    upstream.aclose.assert_awaited()
+
+
+async def test_chat_stream_requires_api_key(gateway_client):
+    response = await gateway_client.post("/chat/stream", json={"message": "hello"})
+    assert response.status_code == 401
+
+
+async def test_chat_stream_upstream_error_status_is_propagated(gateway_client, mocker):
+    upstream = _mock_stream_response(status_code=503, text="Orchestrator not ready")
+    mock_http = MagicMock()
+    mock_http.send = AsyncMock(return_value=upstream)
+    mocker.patch("gateway.main.orchestrator_client", mock_http)
+
+    response = await gateway_client.post(
+        "/chat/stream",
+        json={"message": "hello"},
+        headers={"X-API-Key": "test-api-key"},
+    )
+
+    assert response.status_code == 503
+    upstream.aclose.assert_awaited()
+
+
 def test_rate_limit_allows_requests_within_window(mock_settings):
-    from gateway.main import check_rate_limit, rate_limit_store
+    from gateway.main import check_rate_limit
 
-    rate_limit_store.clear()
     mock_settings.rate_limit_requests = 3
     mock_settings.rate_limit_window = 60
 
@@ -167,12 +225,54 @@ def test_rate_limit_allows_requests_within_window(mock_settings):
 
 
 def test_rate_limit_is_independent_per_key(mock_settings):
-    from gateway.main import check_rate_limit, rate_limit_store
+    from gateway.main import check_rate_limit
 
-    rate_limit_store.clear()
     mock_settings.rate_limit_requests = 1
     mock_settings.rate_limit_window = 60
 
     assert check_rate_limit("key-a") is True
     assert check_rate_limit("key-a") is False
     assert check_rate_limit("key-b") is True  # different key has its own quota
+
+
+@pytest.mark.parametrize("algorithm", ["gcra", "token_bucket"])
+def test_rate_limiter_allows_burst_then_refills(algorithm):
+    from gateway.rate_limit import create_rate_limiter
+
+    limiter = create_rate_limiter(algorithm, requests=2, window=10, burst=2)
+
+    assert limiter.allow("k", now=0.0) is True
+    assert limiter.allow("k", now=0.0) is True
+    assert limiter.allow("k", now=0.0) is False
+    assert limiter.allow("k", now=4.9) is False
+    assert limiter.allow("k", now=5.0) is True  # one request refilled after window / requests
+
+
+@pytest.mark.parametrize("algorithm", ["gcra", "token_bucket"])
+def test_rate_limiter_burst_setting_caps_instant_requests(algorithm):
+    from gateway.rate_limit import create_rate_limiter
+
+    limiter = create_rate_limiter(algorithm, requests=100, window=60, burst=5)
+
+    results = [limiter.allow("k", now=0.0) for _ in range(6)]
+    assert results == [True] * 5 + [False]
+
+
+@pytest.mark.parametrize("algorithm", ["gcra", "token_bucket"])
+def test_rate_limiter_evicts_only_fully_recovered_keys(algorithm):
+    from gateway.rate_limit import create_rate_limiter
+
+    limiter = create_rate_limiter(algorithm, requests=10, window=10)
+    limiter.allow("old", now=0.0)
+    limiter.allow("recent", now=9.5)
+
+    assert limiter.evict_idle(now=10.0) == 1
+    assert len(limiter) == 1
+    assert "recent" in limiter.store
+
+
+def test_rate_limiter_unknown_algorithm_raises():
+    from gateway.rate_limit import create_rate_limiter
+
+    with pytest.raises(ValueError, match="Unknown rate limit algorithm"):
+        create_rate_limiter("sliding_log", requests=10, window=60)
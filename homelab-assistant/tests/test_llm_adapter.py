@@ -178,3 +178,121 @@ async def test_groq_provider_prepends_system_prompt(mocker):
     messages_sent = call_kwargs["messages"]
     assert messages_sent[0]["role"] == "system"
     assert messages_sent[0]["content"] == "You are a homelab assistant."
+
+
+def _stream_chunk(content=None, tool_calls=None, finish_reason=None):
+    delta = MagicMock()
+    delta.content = content
+    delta.tool_calls = tool_calls
+    choice = MagicMock()
+    choice.delta = delta
+    choice.finish_reason = finish_reason
+    chunk = MagicMock()
+    chunk.choices = [choice]
+    return chunk
+
+
+def _tool_call_delta(index, id=None, name=None, arguments=None):
+    tc = MagicMock()
+    tc.index = index
+    tc.id = id
+    tc.function.name = name
+    tc.function.arguments = arguments
+    return tc
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def test_groq_provider_stream_yields_tokens_then_response(mocker):
+    from homelab_schemas import LLMResponse
+    from llm_adapter.providers.groq_provider import GroqProvider
+
+    provider = GroqProvider(api_key="test-key")
+    create_mock = mocker.patch.object(
+        provider.client.chat.completions,
+        "create",
+        new_callable=AsyncMock,
+        return_value=_aiter([
+            _stream_chunk(content="CPU is "),
+            _stream_chunk(content="at 25%."),
+            _stream_chunk(finish_reason="stop"),
+        ]),
+    )
+
+    items = [
+        item async for item in provider.chat_stream(
+            messages=[{"role": "user", "content": "CPU?"}], tools=[]
+        )
+    ]
+
+    assert items[:2] == ["CPU is ", "at 25%."]
+    assert isinstance(items[-1], LLMResponse)
+    assert items[-1].content == "CPU is at 25%."
+    assert items[-1].finish_reason == "stop"
+    assert create_mock.call_args[1]["stream"] is True
+
+
+async def test_openai_stream_accumulates_tool_call_fragments():
+    from llm_adapter.providers.streaming import iter_openai_stream
+
+    chunks = [
+        _stream_chunk(tool_calls=[_tool_call_delta(0, id="call_1", name="list_containers",
+                                                   arguments="")]),
+        _stream_chunk(tool_calls=[_tool_call_delta(0, arguments="{}")]),
+        _stream_chunk(tool_calls=[_tool_call_delta(1, id="call_2", name="get_system_resources",
+                                                   arguments="{}")]),
+        _stream_chunk(finish_reason="tool_calls"),
+    ]
+
+    items = [item async for item in iter_openai_stream(_aiter(chunks))]
+
+    assert len(items) == 1
+    response = items[0]
+    assert response.content is None
+    assert response.finish_reason == "tool_calls"
+    assert [tc["id"] for tc in response.tool_calls] == ["call_1", "call_2"]
+    assert response.tool_calls[0] == {"id": "call_1", "name": "list_containers", "arguments": {}}
+
+
+async def test_chat_stream_endpoint_emits_sse_events(adapter_client, mocker):
+    from homelab_schemas import LLMResponse
+
+    async def fake_stream(**kwargs):
+        yield "All good"
+        yield LLMResponse(content="All good", tool_calls=[], finish_reason="stop")
+
+    mock_provider = MagicMock()
+    mock_provider.chat_stream = fake_stream
+    mocker.patch("llm_adapter.main.provider", mock_provider)
+
+    response = await adapter_client.post(
+        "/chat/stream",
+        json={"messages": [{"role": "user", "content": "ok?"}], "tools": []},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    body = response.text
+    assert 'event: token\ndata: {"content": "All good"}' in body
+    assert "event: response" in body
+
+
+async def test_chat_stream_provider_error_emits_error_event(adapter_client, mocker):
+    async def failing_stream(**kwargs):
+        raise RuntimeError("upstream exploded")
+        yield  # pragma: no cover
+
+    mock_provider = MagicMock()
+    mock_provider.chat_stream = failing_stream
+    mocker.patch("llm_adapter.main.provider", mock_provider)
+
+    response = await adapter_client.post(
+        "/chat/stream",
+        json={"messages": [{"role": "user", "content": "ok?"}], "tools": []},
+    )
+
+    assert "event: error" in response.text
+    assert "upstream exploded" in response.text
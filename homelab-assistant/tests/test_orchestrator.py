@@ -1,4 +1,6 @@
 """Tests for the Orchestrator service."""
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -13,10 +15,21 @@ def mock_settings(mocker):
     mock.monitoring_url = "http://test-monitoring:8003"
     mock.audit_log_path = "/tmp/test-audit.jsonl"
     mock.db_path = ":memory:"
+    mock.tool_max_concurrency = 4
+    mock.tool_call_timeout = 5.0
     mocker.patch("orchestrator.main.settings", mock)
     return mock
 
 
+@pytest.fixture(autouse=True)
+def fresh_tool_cache(mocker):
+    from orchestrator.cache import ToolResultCache
+
+    cache = ToolResultCache()
+    mocker.patch("orchestrator.main.tool_cache", cache)
+    return cache
+
+
 @pytest.fixture
 def mock_audit(mocker):
     return mocker.patch("orchestrator.main.write_audit_log", new_callable=AsyncMock)
@@ -34,7 +47,14 @@ def mock_db(mocker):
 
 
 @pytest.fixture
-async def orchestrator_client(mock_settings, mock_audit, mock_db):
+def mock_monitoring_client(mocker):
+    mock_client = AsyncMock()
+    mocker.patch("orchestrator.main.monitoring_client", mock_client)
+    return mock_client
+
+
+@pytest.fixture
+async def orchestrator_client(mock_settings, mock_audit, mock_db, mock_monitoring_client):
     from orchestrator.main import app
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
@@ -42,12 +62,10 @@ async def orchestrator_client(mock_settings, mock_audit, mock_db):
 
 
 def _mock_llm_http_client(mocker, responses: list):
-    """Create a mock httpx.AsyncClient for the orchestrator's LLM calls."""
+    """Patch the orchestrator's pooled LLM adapter client with a mock."""
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post.side_effect = responses
-    mocker.patch("orchestrator.main.httpx.AsyncClient", return_value=mock_client)
+    mocker.patch("orchestrator.main.llm_client", mock_client)
     return mock_client
 
 
@@ -62,6 +80,48 @@ def _llm_response(content=None, tool_calls=None, finish_reason="stop"):
     return mock_resp
 
 
+class _FakeStreamResponse:
+    """Minimal stand-in for an httpx streaming response carrying SSE lines."""
+
+    def __init__(self, body: str):
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    def raise_for_status(self):
+        return None
+
+    async def aiter_lines(self):
+        for line in self._body.split("\n"):
+            yield line
+
+
+def _mock_llm_stream_client(mocker, bodies: list[str]):
+    """Patch the LLM adapter client so each .stream() call replays one SSE body."""
+    mock_client = MagicMock()
+    mock_client.stream.side_effect = [_FakeStreamResponse(body) for body in bodies]
+    mocker.patch("orchestrator.main.llm_client", mock_client)
+    return mock_client
+
+
+def _sse_llm_turn(content=None, tool_calls=None, finish_reason="stop"):
+    from homelab_common import format_sse
+
+    body = ""
+    if content:
+        body += format_sse("token", {"content": content})
+    body += format_sse("response", {
+        "content": content,
+        "tool_calls": tool_calls or [],
+        "finish_reason": finish_reason,
+    })
+    return body
+
+
 async def test_health_endpoint(orchestrator_client):
     response = await orchestrator_client.get("/health")
     assert response.status_code == 200
@@ -132,20 +192,227 @@ async def test_chat_preserves_provided_conversation_id(orchestrator_client, mock
     assert response.json()["conversation_id"] == "my-conv-123"
 
 
+async def test_concurrent_identical_chats_share_one_llm_call(
+    orchestrator_client, mock_audit, mocker
+):
+    async def slow_llm(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return _llm_response(content="Everything is running.")
+
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = slow_llm
+    mocker.patch("orchestrator.main.llm_client", mock_client)
+
+    responses = await asyncio.gather(
+        orchestrator_client.post(
+            "/chat", json={"message": "Is everything running correctly?", "conversation_id": "a"}
+        ),
+        orchestrator_client.post(
+            "/chat", json={"message": "is everything running correctly", "conversation_id": "b"}
+        ),
+    )
+
+    assert mock_client.post.call_count == 1
+    assert [r.json()["conversation_id"] for r in responses] == ["a", "b"]
+    assert all(r.json()["message"] == "Everything is running." for r in responses)
+    assert mock_audit.call_count == 2
+
+
+async def test_chat_coalescing_can_be_disabled(
+    orchestrator_client, mock_settings, mock_audit, mocker
+):
+    mock_settings.chat_coalescing_enabled = False
+
+    async def slow_llm(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return _llm_response(content="ok")
+
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = slow_llm
+    mocker.patch("orchestrator.main.llm_client", mock_client)
+
+    await asyncio.gather(
+        orchestrator_client.post("/chat", json={"message": "status?"}),
+        orchestrator_client.post("/chat", json={"message": "status?"}),
+    )
+
+    assert mock_client.post.call_count == 2
+
+
 async def test_chat_llm_adapter_unavailable_returns_502(orchestrator_client, mocker):
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.post.side_effect = httpx.HTTPError("connection refused")
-    mocker.patch("orchestrator.main.httpx.AsyncClient", return_value=mock_client)
+    mocker.patch("orchestrator.main.llm_client", mock_client)
 
     response = await orchestrator_client.post("/chat", json={"message": "hello"})
     assert response.status_code == 502
 
 
+async def test_chat_clients_not_initialized_returns_503(orchestrator_client, mocker):
+    mocker.patch("orchestrator.main.llm_client", None)
+
+    response = await orchestrator_client.post("/chat", json={"message": "hello"})
+    assert response.status_code == 503
+
+
+async def test_chat_stream_emits_tokens_progress_and_done(orchestrator_client, mock_audit, mocker):
+    mocker.patch(
+        "orchestrator.main.execute_tool",
+        new_callable=AsyncMock,
+        return_value=[{"name": "plex", "state": "running"}],
+    )
+    _mock_llm_stream_client(
+        mocker,
+        [
+            _sse_llm_turn(
+                tool_calls=[{"id": "tc_1", "name": "list_containers", "arguments": {}}],
+                finish_reason="tool_calls",
+            ),
+            _sse_llm_turn(content="Plex is running."),
+        ],
+    )
+
+    response = await orchestrator_client.post(
+        "/chat/stream", json={"message": "What is running?", "conversation_id": "c-1"}
+    )
+
+    assert response.status_code == 200
+    body = response.text
+    assert body.index("event: progress") < body.index("event: token") < body.index("event: done")
+    assert "Calling list_containers" in body
+    assert '"conversation_id": "c-1"' in body
+    assert '"tool_calls_made": ["list_containers"]' in body
+    mock_audit.assert_called_once()
+
+
+async def test_chat_stream_llm_unavailable_emits_error(orchestrator_client, mock_audit, mocker):
+    mock_client = MagicMock()
+    mock_client.stream.side_effect = httpx.ConnectError("connection refused")
+    mocker.patch("orchestrator.main.llm_client", mock_client)
+
+    response = await orchestrator_client.post("/chat/stream", json={"message": "hello"})
+
+    assert response.status_code == 200
+    assert "event: error" in response.text
+    assert "LLM service unavailable" in response.text
+    mock_audit.assert_not_called()
+
+
+async def test_run_tool_calls_runs_concurrently_and_preserves_order(mock_settings, mocker):
+    from orchestrator.main import run_tool_calls
+
+    delays = {"get_system_resources": 0.1, "list_containers": 0.02}
+
+    async def fake_execute(name, args, client, enabled_tools):
+        await asyncio.sleep(delays[name])
+        return {"tool": name}
+
+    mocker.patch("orchestrator.main.execute_tool", side_effect=fake_execute)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await run_tool_calls(
+        [
+            {"id": "tc_1", "name": "get_system_resources", "arguments": {}},
+            {"id": "tc_2", "name": "list_containers", "arguments": {}},
+        ],
+        set(delays),
+    )
+    elapsed = loop.time() - started
+
+    assert [r["tool_call_id"] for r in results] == ["tc_1", "tc_2"]
+    assert "get_system_resources" in results[0]["content"]
+    assert elapsed < 0.11  # bounded by the slowest tool, not the sum
+
+
+async def test_run_tool_calls_respects_concurrency_cap(mock_settings, mocker):
+    from orchestrator.main import run_tool_calls
+
+    mock_settings.tool_max_concurrency = 1
+    running = 0
+    peak = 0
+
+    async def fake_execute(name, args, client, enabled_tools):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {}
+
+    mocker.patch("orchestrator.main.execute_tool", side_effect=fake_execute)
+
+    await run_tool_calls(
+        [{"id": f"tc_{i}", "name": "list_containers", "arguments": {}} for i in range(3)],
+        {"list_containers"},
+    )
+
+    assert peak == 1
+
+
+async def test_run_tool_calls_timeout_becomes_error_result(mock_settings, mocker):
+    from orchestrator.main import run_tool_calls
+
+    mock_settings.tool_call_timeout = 0.01
+
+    async def fake_execute(name, args, client, enabled_tools):
+        if name == "list_containers":
+            await asyncio.sleep(1)
+        return {"cpu_percent": 5.0}
+
+    mocker.patch("orchestrator.main.execute_tool", side_effect=fake_execute)
+
+    results = await run_tool_calls(
+        [
+            {"id": "tc_1", "name": "list_containers", "arguments": {}},
+            {"id": "tc_2", "name": "get_system_resources", "arguments": {}},
+        ],
+        {"list_containers", "get_system_resources"},
+    )
+
+    assert results[0] == {
+        "role": "tool",
+        "tool_call_id": "tc_1",
+        "content": "Error: list_containers timed out",
+    }
+    assert "cpu_percent" in results[1]["content"]
+
+
+async def test_repeated_tool_calls_are_served_from_shared_cache(mock_settings, mocker):
+    from orchestrator.main import run_tool_calls
+
+    execute = mocker.patch(
+        "orchestrator.main.execute_tool",
+        new_callable=AsyncMock,
+        return_value={"cpu_percent": 12.0},
+    )
+    call = [{"id": "tc_1", "name": "get_system_resources", "arguments": {}}]
+
+    first = await run_tool_calls(call, {"get_system_resources"})
+    second = await run_tool_calls(call, {"get_system_resources"})
+
+    assert first[0]["content"] == second[0]["content"]
+    execute.assert_awaited_once()
+
+
+async def test_disabled_tool_is_rejected_even_when_cached(mock_settings, mocker):
+    from orchestrator.main import run_tool_calls
+
+    mocker.patch(
+        "orchestrator.main.execute_tool",
+        new_callable=AsyncMock,
+        return_value={"cpu_percent": 12.0},
+    )
+    call = [{"id": "tc_1", "name": "get_system_resources", "arguments": {}}]
+
+    await run_tool_calls(call, {"get_system_resources"})
+    results = await run_tool_calls(call, {"list_containers"})
+
+    assert results[0]["content"] == "Error: Unknown tool: get_system_resources"
+
+
 async def test_execute_tool_get_system_resources(mocker):
     from orchestrator.tools import execute_tool
-    from homelab_common.config import Settings
 
     resource_data = {"cpu_percent": 30.0, "memory_total_gb": 16.0}
     mock_resp = MagicMock()
@@ -153,21 +420,16 @@ async def test_execute_tool_get_system_resources(mocker):
     mock_resp.json.return_value = resource_data
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.get.return_value = mock_resp
-    mocker.patch("orchestrator.tools.httpx.AsyncClient", return_value=mock_client)
 
-    result = await execute_tool("get_system_resources", {}, Settings())
+    result = await execute_tool("get_system_resources", {}, mock_client)
 
     assert result == resource_data
-    call_url = mock_client.get.call_args[0][0]
-    assert "/system/resources" in call_url
+    mock_client.get.assert_called_once_with("/system/resources")
 
 
 async def test_execute_tool_list_containers(mocker):
     from orchestrator.tools import execute_tool
-    from homelab_common.config import Settings
 
     containers = [{"id": "abc", "name": "gateway", "status": "running"}]
     mock_resp = MagicMock()
@@ -175,24 +437,19 @@ async def test_execute_tool_list_containers(mocker):
     mock_resp.json.return_value = containers
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value = mock_client
-    mock_client.__aexit__.return_value = None
     mock_client.get.return_value = mock_resp
-    mocker.patch("orchestrator.tools.httpx.AsyncClient", return_value=mock_client)
 
-    result = await execute_tool("list_containers", {}, Settings())
+    result = await execute_tool("list_containers", {}, mock_client)
 
     assert result == containers
-    call_url = mock_client.get.call_args[0][0]
-    assert "/containers" in call_url
+    mock_client.get.assert_called_once_with("/containers")
 
 
 async def test_execute_tool_unknown_name_raises_value_error():
     from orchestrator.tools import execute_tool
-    from homelab_common.config import Settings
 
     with pytest.raises(ValueError, match="Unknown tool"):
-        await execute_tool("delete_all_containers", {}, Settings())
+        await execute_tool("delete_all_containers", {}, AsyncMock())
 
 
 def test_available_tools_contain_only_read_only_operations():
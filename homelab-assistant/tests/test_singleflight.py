@@ -0,0 +1,100 @@
+"""Tests for orchestrator request coalescing."""
+import asyncio
+
+import pytest
+
+
+def test_normalize_message_ignores_case_whitespace_and_trailing_punctuation():
+    from orchestrator.singleflight import normalize_message
+
+    assert normalize_message("  Is everything   running correctly? ") == (
+        "is everything running correctly"
+    )
+    assert normalize_message("IS EVERYTHING RUNNING CORRECTLY!!") == (
+        "is everything running correctly"
+    )
+
+
+def test_request_fingerprint_depends_on_tool_set_not_order():
+    from orchestrator.singleflight import request_fingerprint
+
+    a = request_fingerprint("What is running?", ["list_containers", "get_system_resources"])
+    b = request_fingerprint("what is running", ["get_system_resources", "list_containers"])
+    c = request_fingerprint("what is running", ["get_system_resources"])
+
+    assert a == b
+    assert a != c
+
+
+async def test_concurrent_calls_share_one_computation():
+    from orchestrator.singleflight import SingleFlight
+
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    waiters = [asyncio.create_task(flight.do("k", compute)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["result"] * 5
+    assert calls == 1
+    assert flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 4}
+
+
+async def test_sequential_calls_are_not_coalesced():
+    from orchestrator.singleflight import SingleFlight
+
+    flight = SingleFlight()
+
+    async def compute():
+        return object()
+
+    first = await flight.do("k", compute)
+    second = await flight.do("k", compute)
+
+    assert first is not second
+
+
+async def test_exception_is_shared_with_all_waiters():
+    from orchestrator.singleflight import SingleFlight
+
+    flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do("k", compute), flight.do("k", compute), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    from orchestrator.singleflight import SingleFlight
+
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return 42
+
+    leader = asyncio.create_task(flight.do("k", compute))
+    follower = asyncio.create_task(flight.do("k", compute))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await follower == 42